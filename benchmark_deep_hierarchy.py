@@ -10,7 +10,7 @@ import os
 import sys
 import time
 import tempfile
-import yaml
+import json
 import random
 import string
 import statistics
@@ -24,72 +24,88 @@ sys.path.append(str(Path(__file__).parent / "src"))
 import hierarchical_config_merging as hcm
 
 
+# Value pools for generated configs
+BUSINESS_TERMS = ("corp", "inc", "llc", "ltd", "group", "solutions", "tech", "systems")
+LOGGING_LEVELS = ("debug", "info", "warning", "error")
+COMPLIANCE_LEVELS = ("low", "medium", "high", "strict")
+ENCRYPTIONS = ("AES-256", "RSA-2048", "ChaCha20")
+PASSWORD_POLICIES = ("basic", "medium", "strong")
+PROTOCOLS = ("http", "https", "grpc")
+COMPRESSIONS = ("none", "gzip", "brotli")
+
+
 class DeepHierarchyGenerator:
     """Generate deep organizational hierarchies with inheritance and collisions."""
     
     def __init__(self):
         self.config_id = 0
+        # Level-dependent base settings, built once per level and copied
+        self.base_templates = {}
     
     def generate_realistic_string(self, prefix: str = "config", length: int = 12) -> str:
         """Generate realistic business-like strings."""
-        business_terms = ["corp", "inc", "llc", "ltd", "group", "solutions", "tech", "systems"]
-        return f"{prefix}_{random.choice(business_terms)}_{''.join(random.choices(string.ascii_lowercase, k=length))}"
+        return f"{prefix}_{random.choice(BUSINESS_TERMS)}_{''.join(random.choices(string.ascii_lowercase, k=length))}"
+    
+    def generate_base_settings(self, level: int) -> Dict[str, Any]:
+        """Generate the settings shared by every section type."""
+        template = self.base_templates.get(level)
+        if template is None:
+            template = self.base_templates[level] = {
+                "timeout_seconds": 30 + (level * 5),
+                "retries": 3 + (level % 3),
+                "logging_level": None,
+                "max_connections": 50 + (level * 10)
+            }
+        
+        settings = template.copy()
+        settings["logging_level"] = random.choice(LOGGING_LEVELS)
+        return settings
     
     def generate_config_section(self, section_type: str, level: int) -> Dict[str, Any]:
         """Generate configuration section with level-specific settings."""
-        base_settings = {
-            "timeout_seconds": 30 + (level * 5),
-            "retries": 3 + (level % 3),
-            "logging_level": random.choice(["debug", "info", "warning", "error"]),
-            "max_connections": 50 + (level * 10)
-        }
+        config = self.generate_base_settings(level)
         
         if section_type == "global":
-            return {
-                **base_settings,
-                "company_policy": {
-                    "compliance_level": random.choice(["low", "medium", "high", "strict"]),
-                    "audit_interval_days": 30 + (level * 7),
-                    "data_retention_years": 1 + (level % 5)
-                }
+            config["company_policy"] = {
+                "compliance_level": random.choice(COMPLIANCE_LEVELS),
+                "audit_interval_days": 30 + (level * 7),
+                "data_retention_years": 1 + (level % 5)
             }
         
         elif section_type == "security":
-            return {
-                **base_settings,
-                "security": {
-                    "encryption": random.choice(["AES-256", "RSA-2048", "ChaCha20"]),
-                    "mfa_required": random.choice([True, False]),
-                    "session_timeout_minutes": 15 + (level * 5),
-                    "password_policy": random.choice(["basic", "medium", "strong"])
-                }
+            config["security"] = {
+                "encryption": random.choice(ENCRYPTIONS),
+                "mfa_required": random.random() < 0.5,
+                "session_timeout_minutes": 15 + (level * 5),
+                "password_policy": random.choice(PASSWORD_POLICIES)
             }
         
         elif section_type == "network":
-            return {
-                **base_settings,
-                "network": {
-                    "protocol": random.choice(["http", "https", "grpc"]),
-                    "timeout_ms": 1000 + (level * 100),
-                    "retries": 2 + (level % 4),
-                    "compression": random.choice(["none", "gzip", "brotli"])
-                }
+            config["network"] = {
+                "protocol": random.choice(PROTOCOLS),
+                "timeout_ms": 1000 + (level * 100),
+                "retries": 2 + (level % 4),
+                "compression": random.choice(COMPRESSIONS)
             }
         
         else:  # resources
-            return {
-                **base_settings,
-                "resources": {
-                    "cpu": {
-                        "min": 0.5 + (level * 0.25),
-                        "max": 2.0 + (level * 0.5)
-                    },
-                    "memory_mb": {
-                        "min": 256 + (level * 128),
-                        "max": 1024 + (level * 256)
-                    }
+            config["resources"] = {
+                "cpu": {
+                    "min": 0.5 + (level * 0.25),
+                    "max": 2.0 + (level * 0.5)
+                },
+                "memory_mb": {
+                    "min": 256 + (level * 128),
+                    "max": 1024 + (level * 256)
                 }
             }
+        
+        return config
+    
+    def write_config(self, config_file: Path, config: Dict[str, Any]):
+        """Write a config file as JSON, which YAML parsers read as YAML."""
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
     
     def create_deep_hierarchy(self, base_dir: Path) -> Dict[str, List[Path]]:
         """Create deep organizational hierarchy: company/continent/country/size/resource/person."""
@@ -106,8 +122,7 @@ class DeepHierarchyGenerator:
             config_file = company_dir / f"{config_type}_policy.yaml"
             config = self.generate_config_section(config_type, 0)  # Level 0
             
-            with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            self.write_config(config_file, config)
             
             company_configs.append(config_file)
         
@@ -128,8 +143,7 @@ class DeepHierarchyGenerator:
                 if config_type == "security":
                     config["security"]["mfa_required"] = True  # Override company policy
                 
-                with open(config_file, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False)
+                self.write_config(config_file, config)
             
             continent_dirs.append(continent_dir)
         
@@ -154,8 +168,7 @@ class DeepHierarchyGenerator:
                     if config_type == "network":
                         config["network"]["timeout_ms"] = 2000 + (country_id * 100)  # Override
                     
-                    with open(config_file, 'w') as f:
-                        yaml.dump(config, f, default_flow_style=False)
+                    self.write_config(config_file, config)
                 
                 country_dirs.append(country_dir)
         
@@ -179,8 +192,7 @@ class DeepHierarchyGenerator:
                     config["resources"]["memory_mb"]["min"] = int(config["resources"]["memory_mb"]["min"] * multiplier)
                     config["resources"]["memory_mb"]["max"] = int(config["resources"]["memory_mb"]["max"] * multiplier)
                 
-                with open(config_file, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False)
+                self.write_config(config_file, config)
                 
                 size_dirs.append(size_dir)
         
@@ -197,8 +209,7 @@ class DeepHierarchyGenerator:
                     config_file = resource_dir / f"{config_type}_policy.yaml"
                     config = self.generate_config_section(config_type, 4)  # Level 4
                     
-                    with open(config_file, 'w') as f:
-                        yaml.dump(config, f, default_flow_style=False)
+                    self.write_config(config_file, config)
                 
                 resource_dirs.append(resource_dir)
         
@@ -233,8 +244,7 @@ class DeepHierarchyGenerator:
                     else:
                         config = self.generate_config_section(config_type, 5)  # Level 5
                     
-                    with open(config_file, 'w') as f:
-                        yaml.dump(config, f, default_flow_style=False)
+                    self.write_config(config_file, config)
                 
                 employee_dirs.append(employee_dir)
         
@@ -14,6 +14,12 @@ sys.path.append(str(Path(__file__).parent / "src"))
 
 import hierarchical_config_merging as hcm
 
+# Prefer the libyaml-backed emitter for YAML output
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 def main():
     parser = argparse.ArgumentParser(
         description="Hierarchical YAML config merger"
@@ -59,7 +65,7 @@ def main():
     if args.output == "json":
         print(json.dumps(merged_config, indent=2, ensure_ascii=False))
     else:  # yaml
-        print(yaml.dump(merged_config, default_flow_style=False, sort_keys=False))
+        print(yaml.dump(merged_config, Dumper=YamlDumper, default_flow_style=False, sort_keys=False))
 
 if __name__ == "__main__":
     import sys
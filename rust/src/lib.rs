@@ -24,46 +24,28 @@ pub fn find_yaml_files_in_hierarchy(base_dir: &Path, target_path: &Path) -> Resu
 
     let mut yaml_files = Vec::new();
 
-    // Get relative path from base to target
+    // Only the directories on the chain base -> target can contribute,
+    // so list those instead of walking every sibling subtree
     let target_relative = target_path.strip_prefix(&base_dir)?;
-    let target_parts: Vec<&str> = target_relative
-        .components()
-        .filter_map(|c| c.as_os_str().to_str())
-        .collect();
-
-    // Walk through the directory tree
-    for entry in walkdir::WalkDir::new(&base_dir)
-        .follow_links(true)
-    {
-        let entry = entry?;
-        let path = entry.path();
-
-        if !path.is_file() {
-            continue;
-        }
+    let mut hierarchy_dirs = vec![base_dir.clone()];
+    for component in target_relative.components() {
+        let mut directory = hierarchy_dirs[hierarchy_dirs.len() - 1].clone();
+        directory.push(component);
+        hierarchy_dirs.push(directory);
+    }
+
+    for directory in &hierarchy_dirs {
+        for entry in fs::read_dir(directory)? {
+            let path = entry?.path();
+
+            if !path.is_file() {
+                continue;
+            }
 
-        // Check if it's a YAML file
-        if let Some(ext) = path.extension() {
-            if ext == "yaml" || ext == "yml" {
-                let root_relative = path.strip_prefix(&base_dir)?;
-                let root_parts: Vec<&str> = root_relative
-                    .components()
-                    .filter_map(|c| c.as_os_str().to_str())
-                    .collect();
-
-                // Remove the filename from parts
-                let root_dir_parts = if root_parts.len() > 0 {
-                    &root_parts[..root_parts.len() - 1]
-                } else {
-                    &[]
-                };
-
-                // Check if this directory is included in target hierarchy
-                if root_dir_parts.is_empty() || 
-                   (root_dir_parts.len() <= target_parts.len() && 
-                    root_dir_parts == &target_parts[..root_dir_parts.len()])
-                {
-                    yaml_files.push(path.to_path_buf());
+            // Check if it's a YAML file
+            if let Some(ext) = path.extension() {
+                if ext == "yaml" || ext == "yml" {
+                    yaml_files.push(path);
                 }
             }
         }
@@ -89,21 +71,27 @@ pub fn parse_yaml_configs(yaml_files: &[PathBuf]) -> Result<HashMap<String, Conf
 }
 
 pub fn deep_merge(base: &ConfigValue, r#override: &ConfigValue) -> ConfigValue {
+    let mut result = base.clone();
+    deep_merge_into(&mut result, r#override);
+    result
+}
+
+/// Merge `override` into `base` in place, only cloning the values it inserts
+pub fn deep_merge_into(base: &mut ConfigValue, r#override: &ConfigValue) {
     match (base, r#override) {
         (ConfigValue::Mapping(base_map), ConfigValue::Mapping(override_map)) => {
-            let mut result = base_map.clone();
             for (key, value) in override_map {
-                if let Some(base_value) = result.get(key) {
+                match base_map.get_mut(key) {
                     // Recursively merge if both are mappings
-                    result.insert(key.clone(), deep_merge(base_value, value));
-                } else {
+                    Some(base_value) => deep_merge_into(base_value, value),
                     // Insert new value
-                    result.insert(key.clone(), value.clone());
+                    None => {
+                        base_map.insert(key.clone(), value.clone());
+                    }
                 }
             }
-            ConfigValue::Mapping(result)
         }
-        _ => r#override.clone(), // Override with new value
+        (base, value) => *base = value.clone(), // Override with new value
     }
 }
 
@@ -159,7 +147,7 @@ pub fn merge_configs_by_depth(
 
         // Merge configs at this depth
         for (_, config) in depth_configs {
-            merged_config = deep_merge(&merged_config, config);
+            deep_merge_into(&mut merged_config, config);
         }
     }
 
@@ -7,10 +7,35 @@ based on directory depth priority.
 """
 
 import os
+import json
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-from collections import defaultdict
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Prefer the libyaml-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# (st_mtime_ns, st_size) of a file, changes whenever the file is rewritten
+_FileStamp = Tuple[int, int]
+# Files of one hierarchy directory with their stamps
+_Level = Tuple[Tuple[str, _FileStamp], ...]
+
+# Parsed configs by file path, along with the stamp they were parsed at
+_PARSE_CACHE: Dict[str, Tuple[_FileStamp, Dict[str, Any]]] = {}
+_PARSE_CACHE_MAX_ENTRIES = 4096
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Prefix merges by hierarchy directory, see _merge_prefix
+_PREFIX_CACHE: Dict[str, '_PrefixNode'] = {}
+_PREFIX_CACHE_MAX_ENTRIES = 4096
+_PREFIX_CACHE_LOCK = threading.Lock()
+
+# Suffix of the opt-in (HCM_CACHE=1) on-disk parse cache files
+_SIDECAR_SUFFIX = '.cache.json'
 
 
 def find_yaml_files_in_hierarchy(base_dir: Path, target_path: Path) -> List[Path]:
@@ -33,44 +58,201 @@ def find_yaml_files_in_hierarchy(base_dir: Path, target_path: Path) -> List[Path
         - "aaa/a/a/b/*.yaml" (included)
         - "aaa/a/c/b/*.yaml" (not included - "a/c/b" not in "a/a/b")
     """
-    base_dir = base_dir.resolve()
-    target_path = target_path.resolve()
+    return [Path(yaml_file)
+            for directory, yaml_files in _find_yaml_files(base_dir, target_path)
+            for yaml_file in yaml_files]
+
+
+def _find_yaml_files(base_dir: Path, target_path: Path) -> List[Tuple[str, List[str]]]:
+    """
+    Same as find_yaml_files_in_hierarchy, but with plain string paths
+    grouped by directory, shallowest first.
+    """
+    # Resolve symlinks once, so a link inside base_dir cannot lead the
+    # walk outside of it and paths match the Rust implementation's
+    base_dir = os.path.realpath(base_dir)
+    target_path = os.path.realpath(target_path)
+    
+    # Joining '' appends exactly one separator, even for a root base_dir
+    base_prefix = os.path.join(base_dir, '')
     
-    # Ensure target_path is within base_dir
-    if not str(target_path).startswith(str(base_dir)):
+    # Ensure target_path is within base_dir, then slice off the prefix
+    # to get the path components from base to target
+    if target_path == base_dir:
+        target_parts = ()
+    elif target_path.startswith(base_prefix):
+        target_parts = tuple(target_path[len(base_prefix):].split(os.sep))
+    else:
         raise ValueError(f"Target path {target_path} is not within base directory {base_dir}")
     
-    yaml_files = []
+    return list(_walk_prefix(base_dir, target_parts))
+
+
+def _walk_prefix(base_dir: str, target_parts: Tuple[str, ...]) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (directory, yaml_files) for base_dir and each directory down
+    target_parts, skipping directories without YAML files.
     
-    # Get relative path from base to target
-    target_relative = target_path.relative_to(base_dir)
-    target_parts = target_relative.parts
+    Only the directories on the chain base -> target can contribute, so the
+    walk descends into the next target component and never into siblings.
+    """
+    directory = base_dir
     
-    # Walk through the directory tree
-    for root, dirs, files in os.walk(base_dir):
-        root_path = Path(root)
-        root_relative = root_path.relative_to(base_dir)
-        root_parts = root_relative.parts
+    for depth in range(len(target_parts) + 1):
+        next_part = target_parts[depth] if depth < len(target_parts) else None
+        next_is_dir = False
+        yaml_files = []
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == next_part:
+                        next_is_dir = entry.is_dir()
+                    if name.endswith(('.yaml', '.yml')) and entry.is_file():
+                        yaml_files.append(entry.path)
+        except OSError:
+            # Unreadable, like os.walk the rest of the chain is skipped
+            return
         
-        # Check if this directory is included in target hierarchy
-        # The root should be either:
-        # 1. The base directory itself (always included)
-        # 2. A parent directory in the target path hierarchy
-        if (len(root_parts) == 0 or  # Base directory
-            (len(root_parts) <= len(target_parts) and 
-             root_parts == target_parts[:len(root_parts)])):
-            # This directory is in the hierarchy, add all YAML files
-            for file in files:
-                if file.endswith('.yaml') or file.endswith('.yml'):
-                    yaml_files.append(root_path / file)
+        if yaml_files:
+            yield directory, yaml_files
+        
+        # The listing already tells whether the chain continues on disk
+        if not next_is_dir:
+            return
+        directory = os.path.join(directory, next_part)
+
+
+def _load_one(yaml_file: Union[str, Path]) -> Dict[str, Any]:
+    """Read and parse a single YAML file, empty files yield an empty dict."""
+    try:
+        # Opt-in on-disk cache of parsed YAML, see _read_sidecar
+        use_sidecar = os.environ.get("HCM_CACHE") == "1"
+        if use_sidecar:
+            stamp = _file_stamp(str(yaml_file))
+            config = _read_sidecar(yaml_file, stamp)
+            if config is not None:
+                return config
+        
+        # Read in one call, then let libyaml parse the raw bytes directly
+        # instead of pulling chunks from the file object during the parse
+        data = _read_bytes(yaml_file)
+        
+        # JSON is valid YAML and the json module's C parser is much faster,
+        # flow-style YAML that is not strict JSON falls back to libyaml
+        if data.lstrip()[:1] in (b'{', b'['):
+            try:
+                return json.loads(data, parse_float=_parse_json_float,
+                                  parse_constant=_reject_json_constant) or {}
+            except ValueError:
+                pass
+        
+        config = yaml.load(data, Loader=_Loader) or {}
+        if use_sidecar:
+            _write_sidecar(yaml_file, stamp, config)
+        return config
+    except Exception as e:
+        raise Exception(f"Failed to parse {yaml_file}: {e}")
+
+
+def _parse_json_float(literal: str) -> float:
+    """
+    Parse a JSON float literal, rejecting those YAML 1.1 does not read as floats.
     
-    return yaml_files
+    YAML 1.1 floats need a '.' and a signed exponent, so 1e3 and 1.0e3 are
+    strings to libyaml. Raising sends the document back to the YAML parser.
+    """
+    mantissa, _, exponent = literal.lower().partition('e')
+    if '.' not in mantissa or (exponent and exponent[0] not in '+-'):
+        raise ValueError(f"not a YAML float: {literal}")
+    return float(literal)
+
+
+def _reject_json_constant(constant: str) -> Any:
+    """NaN and Infinity are not JSON, libyaml reads them as strings."""
+    raise ValueError(f"not a YAML float: {constant}")
+
+
+def _read_bytes(file_path: Union[str, Path]) -> bytes:
+    """
+    Read a whole file with a single read sized by fstat.
+    
+    Skips the buffered file object layer, whose setup costs as much as the
+    read itself for small config files.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)]
+        remaining = size - len(chunks[0])
+        
+        # Short reads are rare on regular files, finish up to the stat size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_sidecar(yaml_file: Union[str, Path], stamp: _FileStamp) -> Optional[Dict[str, Any]]:
+    """
+    Load the JSON sidecar of a YAML file if it was written for this version.
+    
+    Sidecars live next to the YAML file as <name>.cache.json and record the
+    stamp of the file they were parsed from, so any edit invalidates them.
+    """
+    try:
+        cached = json.loads(_read_bytes(f"{yaml_file}{_SIDECAR_SUFFIX}"))
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get("stamp") != list(stamp):
+        return None
+    return cached.get("config")
+
+
+def _write_sidecar(yaml_file: Union[str, Path], stamp: _FileStamp, config: Any) -> None:
+    """Write the JSON sidecar of a YAML file, skipping configs JSON cannot hold."""
+    if not _is_json_safe(config):
+        return
+    
+    sidecar = f"{yaml_file}{_SIDECAR_SUFFIX}"
+    temp_file = f"{sidecar}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"stamp": list(stamp), "config": config}, f)
+        # Atomic so concurrent readers never see a partial sidecar
+        os.replace(temp_file, sidecar)
+    except OSError:
+        # Read-only config directories simply go without a cache
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+
+def _is_json_safe(value: Any) -> bool:
+    """Whether JSON round-trips value unchanged (no dates, non-string keys...)."""
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_safe(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_is_json_safe(item) for item in value)
+    return value is None or isinstance(value, (str, int, float, bool))
 
 
 def parse_yaml_configs(yaml_files: List[Path]) -> Dict[str, Dict[str, Any]]:
     """
     Parse all YAML config files into a dictionary mapping.
     
+    Files unchanged since their last parse are served from an in-memory
+    cache, each call still returns its own copies.
+    
     Args:
         yaml_files: List of YAML file paths
         
@@ -81,14 +263,8 @@ def parse_yaml_configs(yaml_files: List[Path]) -> Dict[str, Dict[str, Any]]:
         Exception: If any YAML file cannot be parsed
     """
     configs = {}
-    
     for yaml_file in yaml_files:
-        try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-                configs[str(yaml_file)] = config
-        except Exception as e:
-            raise Exception(f"Failed to parse {yaml_file}: {e}")
+        configs[str(yaml_file)] = _load_copy(yaml_file)
     
     return configs
 
@@ -109,43 +285,67 @@ def merge_configs_by_depth(configs: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str
     if not configs:
         return {}, []
     
-    # Group configs by depth (directory level)
-    depth_groups = defaultdict(list)
+    # Group configs by depth (directory level), depths are small integers
+    # so a list indexed by depth keeps them ordered without sorting
+    depths = [_path_depth(file_path) for file_path in configs]
+    depth_groups = [[] for _ in range(max(depths) + 1)]
     
-    for file_path, config in configs.items():
-        path_obj = Path(file_path)
-        # Count directory depth relative to the common base
-        depth = len(path_obj.parts)
+    for depth, (file_path, config) in zip(depths, configs.items()):
         depth_groups[depth].append((file_path, config))
     
     merged_config = {}
     errors = []
     
     # Process configs from shallowest to deepest
-    for depth in sorted(depth_groups.keys()):
-        depth_configs = depth_groups[depth]
-        
-        # Check for key collisions at the same depth
-        all_keys_at_depth = set()
-        key_sources = {}
-        
-        for file_path, config in depth_configs:
-            for key in config.keys():
-                if key in all_keys_at_depth:
-                    # Collision at same depth
-                    existing_source = key_sources[key]
-                    errors.append(f"Key collision at depth {depth}: '{key}' found in both {existing_source} and {file_path}")
-                else:
-                    all_keys_at_depth.add(key)
-                    key_sources[key] = file_path
-        
-        # Merge configs at this depth
-        for file_path, config in depth_configs:
-            merged_config = _deep_merge(merged_config, config)
+    for depth, depth_configs in enumerate(depth_groups):
+        if depth_configs:
+            merged_config = _merge_depth_group(merged_config, depth, depth_configs, errors)
     
     return merged_config, errors
 
 
+def _path_depth(file_path: str) -> int:
+    """
+    Number of components in a normalized file path, same as len(Path(file_path).parts).
+    
+    Counting separators avoids building a Path for every config.
+    """
+    return file_path.count(os.sep) + 1
+
+
+def _merge_depth_group(merged_config: Dict[str, Any], depth: int,
+                       depth_configs: List[Tuple[str, Dict[str, Any]]],
+                       errors: List[str]) -> Dict[str, Any]:
+    """
+    Merge all configs of a single depth on top of merged_config.
+    
+    Key collisions between configs of this depth are appended to errors.
+    """
+    # Files seen at this depth for each key, a second file means a collision
+    key_sources = {}
+    
+    for file_path, config in depth_configs:
+        for key, value in config.items():
+            if key in key_sources:
+                # Collision at same depth
+                existing_source = key_sources[key]
+                errors.append(f"Key collision at depth {depth}: '{key}' found in both {existing_source} and {file_path}")
+            else:
+                key_sources[key] = file_path
+            
+            # Merge the value in the same pass
+            if isinstance(value, dict):
+                current = merged_config.get(key)
+                if isinstance(current, dict):
+                    _deep_merge_inplace(current, value)
+                else:
+                    merged_config[key] = _copy_config(value)
+            else:
+                merged_config[key] = value
+    
+    return merged_config
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """
     Recursively merge two dictionaries.
@@ -153,19 +353,197 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     Values from override take precedence over base.
     Nested dictionaries are merged recursively.
     """
-    result = base.copy()
+    result = {}
+    _deep_merge_inplace(result, base)
+    _deep_merge_inplace(result, override)
     
-    for key, value in override.items():
-        if (key in result and 
-            isinstance(result[key], dict) and 
-            isinstance(value, dict)):
-            # Recursively merge nested dictionaries
-            result[key] = _deep_merge(result[key], value)
+    return result
+
+
+def _deep_merge_inplace(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """
+    Merge src into dst, mutating dst.
+    
+    Nested dictionaries of src are never stored in dst as-is, they are
+    merged into dictionaries owned by dst or copied, so src is left
+    untouched by later merges into dst. Only subtrees that are dictionaries
+    on both sides are recursed into, which keeps self-referencing src
+    dictionaries from recursing forever.
+    """
+    for key, value in src.items():
+        if isinstance(value, dict):
+            current = dst.get(key)
+            if isinstance(current, dict):
+                # Recursively merge nested dictionaries
+                _deep_merge_inplace(current, value)
+            else:
+                dst[key] = _copy_config(value)
         else:
             # Override with new value
-            result[key] = value
+            dst[key] = value
+
+
+def _file_stamp(file_path: str) -> _FileStamp:
+    """Stamp identifying a version of a file, size catches coarse mtimes."""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached(yaml_file: str, stamp: _FileStamp) -> Dict[str, Any]:
+    """Parse a YAML file once per version. Do not mutate the result."""
+    cached = _PARSE_CACHE.get(yaml_file)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     
-    return result
+    config = _load_one(yaml_file)
+    
+    with _PARSE_CACHE_LOCK:
+        # Keyed by path alone so an edited file replaces its stale entry,
+        # past the size limit the least recently parsed file is dropped
+        _PARSE_CACHE.pop(yaml_file, None)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX_ENTRIES:
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[yaml_file] = (stamp, config)
+    
+    return config
+
+
+def _load_copy(yaml_file: Union[str, Path]) -> Dict[str, Any]:
+    """Parse a YAML file through the parse cache, returning a private copy."""
+    file_path = str(yaml_file)
+    try:
+        stamp = _file_stamp(file_path)
+    except OSError as e:
+        raise Exception(f"Failed to parse {yaml_file}: {e}")
+    
+    return _copy_config(_load_cached(file_path, stamp))
+
+
+def _stat_hierarchy_levels(hierarchy_files: List[Tuple[str, List[str]]]) -> Tuple[Tuple[str, _Level], ...]:
+    """
+    Stamp the files of each hierarchy directory, shallowest first.
+    
+    Each level is a tuple of (path, stamp) pairs, which makes it usable
+    as a cache key that changes whenever a file is added, removed or edited.
+    Files deleted since the scan are dropped, as if the scan came after.
+    """
+    levels = []
+    
+    for directory, yaml_files in hierarchy_files:
+        level = []
+        for file_path in yaml_files:
+            try:
+                level.append((file_path, _file_stamp(file_path)))
+            except FileNotFoundError:
+                continue
+        if level:
+            levels.append((directory, tuple(level)))
+    
+    return tuple(levels)
+
+
+class _PrefixNode(NamedTuple):
+    """Cached merge of a base -> directory chain, one node per directory."""
+    parent: Optional['_PrefixNode']
+    level: _Level
+    merged_config: Dict[str, Any]
+    errors: Tuple[str, ...]
+
+
+def _merge_prefix(levels: Tuple[Tuple[str, _Level], ...]) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Merge the configs of a base -> directory chain, memoized per prefix.
+    
+    Each directory's node is reused while its files are unchanged and it
+    was built on top of the node just reused for the previous level, so
+    targets sharing ancestors only merge their own levels. Do not mutate
+    the result.
+    """
+    node = None
+    
+    for directory, level in levels:
+        cached = _PREFIX_CACHE.get(directory)
+        if cached is None or cached.parent is not node or cached.level != level:
+            cached = _merge_level(node, level)
+            with _PREFIX_CACHE_LOCK:
+                # Same policy as the parse cache, the least recently merged
+                # directory goes first
+                _PREFIX_CACHE.pop(directory, None)
+                if len(_PREFIX_CACHE) >= _PREFIX_CACHE_MAX_ENTRIES:
+                    del _PREFIX_CACHE[next(iter(_PREFIX_CACHE))]
+                _PREFIX_CACHE[directory] = cached
+        node = cached
+    
+    return node.merged_config, node.errors
+
+
+def _merge_level(parent: Optional[_PrefixNode], level: _Level) -> _PrefixNode:
+    """Merge the files of one directory on top of the parent prefix."""
+    depth_configs = [(file_path, _load_cached(file_path, stamp))
+                     for file_path, stamp in level]
+    
+    if parent is not None:
+        # Copy on write: share the parent's subtrees this level leaves alone
+        merged_config = dict(parent.merged_config)
+        for file_path, config in depth_configs:
+            _unshare_merge_path(merged_config, config)
+        errors = parent.errors
+    elif len(depth_configs) == 1 and isinstance(depth_configs[0][1], dict):
+        # A lone file at the top can neither collide nor override anything,
+        # its parsed config is shared as-is since nodes are never mutated
+        return _PrefixNode(parent, level, depth_configs[0][1], ())
+    else:
+        merged_config, errors = {}, ()
+    
+    depth = _path_depth(depth_configs[0][0])
+    
+    level_errors = []
+    merged_config = _merge_depth_group(merged_config, depth, depth_configs, level_errors)
+    
+    return _PrefixNode(parent, level, merged_config, errors + tuple(level_errors))
+
+
+def _unshare_merge_path(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """
+    Shallow-copy the nested dictionaries of dst that merging src would mutate.
+    
+    After this, _deep_merge_inplace(dst, src) leaves dictionaries shared
+    with another config untouched.
+    """
+    for key, value in src.items():
+        if isinstance(value, dict):
+            current = dst.get(key)
+            if isinstance(current, dict):
+                dst[key] = current = dict(current)
+                _unshare_merge_path(current, value)
+
+
+def _copy_config(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Copy the dict and list containers of a config, scalars are shared.
+    
+    Like copy.deepcopy, containers already copied are looked up in memo by
+    id(), so YAML anchors that refer to themselves copy without recursing
+    forever.
+    """
+    if not isinstance(value, (dict, list)):
+        return value
+    if memo is None:
+        memo = {}
+    
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    
+    if isinstance(value, dict):
+        copied = memo[id(value)] = {}
+        for key, item in value.items():
+            copied[key] = _copy_config(item, memo)
+    else:
+        copied = memo[id(value)] = []
+        for item in value:
+            copied.append(_copy_config(item, memo))
+    return copied
 
 
 def merge_hierarchical_configs(base_dir: Path, target_path: Path) -> Tuple[Dict[str, Any], List[str]]:
@@ -180,15 +558,13 @@ def merge_hierarchical_configs(base_dir: Path, target_path: Path) -> Tuple[Dict[
         Tuple of (merged_config, errors) where errors contains any collision messages
     """
     # Find YAML files in hierarchy
-    yaml_files = find_yaml_files_in_hierarchy(base_dir, target_path)
+    levels = _stat_hierarchy_levels(_find_yaml_files(base_dir, target_path))
     
-    if not yaml_files:
+    if not levels:
         return {}, [f"No YAML files found in hierarchy from {base_dir} to {target_path}"]
     
-    # Parse YAML configs
-    configs = parse_yaml_configs(yaml_files)
-    
-    # Merge configs by depth
-    merged_config, errors = merge_configs_by_depth(configs)
+    # Parse and merge configs by depth, reusing cached ancestor merges
+    merged_config, errors = _merge_prefix(levels)
     
-    return merged_config, errors
\ No newline at end of file
+    # The cached merge is shared, hand the caller its own copy
+    return _copy_config(merged_config), list(errors)
\ No newline at end of file
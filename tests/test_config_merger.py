@@ -5,8 +5,9 @@ Comprehensive tests for hierarchical config merging.
 These tests will also be used for the Rust implementation via bindings.
 """
 
+import os
 import tempfile
-import yaml
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -24,12 +25,8 @@ def test_find_yaml_files_in_hierarchy_basic():
         target_dir = base_dir / "a" / "a" / "b"
         
         # Create directory structure
-        base_dir.mkdir(parents=True)
-        (base_dir / "a").mkdir()
-        (base_dir / "a" / "a").mkdir()
-        (base_dir / "a" / "a" / "b").mkdir()
-        (base_dir / "a" / "c").mkdir()
-        (base_dir / "a" / "c" / "b").mkdir()
+        os.makedirs(base_dir / "a" / "a" / "b", exist_ok=True)
+        os.makedirs(base_dir / "a" / "c" / "b", exist_ok=True)
         
         # Create YAML files
         (base_dir / "config.yaml").write_text("base: config")
@@ -69,6 +66,34 @@ def test_find_yaml_files_in_hierarchy_target_outside_base():
             hcm.find_yaml_files_in_hierarchy(base_dir, target_dir)
 
 
+def test_find_yaml_files_in_hierarchy_target_in_prefixed_sibling():
+    """Test error when target is in a sibling sharing the base name as prefix."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        target_dir = Path(temp_dir) / "aaa_sibling" / "a"
+        
+        base_dir.mkdir()
+        target_dir.mkdir(parents=True)
+        
+        with pytest.raises(ValueError, match="Target path .* is not within base directory"):
+            hcm.find_yaml_files_in_hierarchy(base_dir, target_dir)
+
+
+def test_find_yaml_files_in_hierarchy_symlink_outside_base():
+    """Test that a symlink inside base_dir cannot lead outside of it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        outside_dir = Path(temp_dir) / "outside"
+        
+        base_dir.mkdir()
+        outside_dir.mkdir()
+        (outside_dir / "config.yaml").write_text("outside: config")
+        (base_dir / "link").symlink_to(outside_dir, target_is_directory=True)
+        
+        with pytest.raises(ValueError, match="not within base directory"):
+            hcm.find_yaml_files_in_hierarchy(base_dir, base_dir / "link")
+
+
 def test_parse_yaml_configs():
     """Test YAML config parsing."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -86,7 +111,7 @@ def test_parse_yaml_configs():
             }
             
             with open(config_file, 'w') as f:
-                yaml.dump(config_data, f)
+                f.write(json.dumps(config_data))
             
             config_files.append(config_file)
         
@@ -113,6 +138,55 @@ def test_parse_yaml_configs_invalid_yaml():
             hcm.parse_yaml_configs([config_file])
 
 
+def test_parse_yaml_configs_json_and_flow_style():
+    """Test that JSON documents and non-JSON flow mappings both parse."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_file = Path(temp_dir) / "json.yaml"
+        json_file.write_text('{"name": "json", "nested": {"values": [1, 2.5, true, null]}}')
+        
+        flow_file = Path(temp_dir) / "flow.yaml"
+        flow_file.write_text("{name: flow, nested: {enabled: yes}}")
+        
+        # Valid for the json module, but strings to a YAML 1.1 parser
+        numbers_file = Path(temp_dir) / "numbers.yaml"
+        numbers_file.write_text('{"exp": 1e3, "signless": 1.0e3, "signed": 1.5e+3, "nan": NaN, "inf": Infinity}')
+        
+        configs = hcm.parse_yaml_configs([json_file, flow_file, numbers_file])
+        
+        assert configs[str(json_file)] == {"name": "json", "nested": {"values": [1, 2.5, True, None]}}
+        assert configs[str(flow_file)] == {"name": "flow", "nested": {"enabled": True}}
+        assert configs[str(numbers_file)] == {"exp": "1e3", "signless": "1.0e3", "signed": 1500.0,
+                                              "nan": "NaN", "inf": "Infinity"}
+
+
+def test_parse_yaml_configs_utf8():
+    """Test that non-ASCII content is decoded from the raw UTF-8 bytes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yaml_file = Path(temp_dir) / "config.yaml"
+        yaml_file.write_bytes("city: Zürich\ngreeting: こんにちは".encode('utf-8'))
+        
+        json_file = Path(temp_dir) / "config_json.yaml"
+        json_file.write_bytes('{"city": "Zürich", "currency": "€"}'.encode('utf-8'))
+        
+        configs = hcm.parse_yaml_configs([yaml_file, json_file])
+        
+        assert configs[str(yaml_file)] == {"city": "Zürich", "greeting": "こんにちは"}
+        assert configs[str(json_file)] == {"city": "Zürich", "currency": "€"}
+
+
+def test_parse_yaml_configs_recursive_anchor():
+    """Test that configs containing themselves through an anchor can be parsed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = Path(temp_dir) / "config.yaml"
+        config_file.write_text("a: &x [1, *x]\nb: &y {k: *y}")
+        
+        config = hcm.parse_yaml_configs([config_file])[str(config_file)]
+        
+        assert config["a"][0] == 1
+        assert config["a"][1] is config["a"]
+        assert config["b"]["k"] is config["b"]
+
+
 def test_deep_merge_basic():
     """Test basic dictionary merging."""
     base = {"a": 1, "b": 2, "c": {"nested": "base"}}
@@ -219,11 +293,7 @@ def test_merge_hierarchical_configs_integration():
         target_dir = base_dir / "env" / "prod" / "region" / "eu"
         
         # Create directory structure
-        base_dir.mkdir(parents=True)
-        (base_dir / "env").mkdir()
-        (base_dir / "env" / "prod").mkdir()
-        (base_dir / "env" / "prod" / "region").mkdir()
-        (base_dir / "env" / "prod" / "region" / "eu").mkdir()
+        os.makedirs(target_dir, exist_ok=True)
         
         # Create YAML configs
         configs = {
@@ -261,7 +331,7 @@ def test_merge_hierarchical_configs_integration():
             config_path = base_dir / rel_path / "config.yaml"
             config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+                f.write(json.dumps(config_data))
         
         # Merge configs
         merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
@@ -308,9 +378,7 @@ def test_merge_hierarchical_configs_collision():
         target_dir = base_dir / "level1" / "level2"
         
         # Create directory structure
-        base_dir.mkdir(parents=True)
-        (base_dir / "level1").mkdir()
-        (base_dir / "level1" / "level2").mkdir()
+        os.makedirs(target_dir, exist_ok=True)
         
         # Create configs with same key at same depth
         (base_dir / "level1" / "config1.yaml").write_text("key: value1")
@@ -325,4 +393,182 @@ def test_merge_hierarchical_configs_collision():
         assert "Key collision" in errors[0]
         
         # Should still merge (deepest value wins)
-        assert merged_config["key"] == "value3"
\ No newline at end of file
+        assert merged_config["key"] == "value3"
+
+
+def test_merge_hierarchical_configs_single_file():
+    """Test that a single config file is returned as parsed."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        target_dir = base_dir / "level1"
+        
+        target_dir.mkdir(parents=True)
+        (base_dir / "config.yaml").write_text("key: value\nnested:\n  a: 1")
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert len(errors) == 0
+        assert merged_config == {"key": "value", "nested": {"a": 1}}
+        
+        # The result is the caller's own copy
+        merged_config["nested"]["a"] = 2
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert merged_config == {"key": "value", "nested": {"a": 1}}
+        
+        # A document that is not a mapping fails like it does in a merge
+        (base_dir / "config.yaml").write_text("- 1\n- 2")
+        with pytest.raises(Exception):
+            hcm.merge_hierarchical_configs(base_dir, target_dir)
+
+
+def test_merge_hierarchical_configs_result_mutation():
+    """Test that mutating a result does not leak into merges sharing its ancestors."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        os.makedirs(base_dir / "a", exist_ok=True)
+        os.makedirs(base_dir / "b", exist_ok=True)
+        
+        (base_dir / "config.yaml").write_text("db:\n  host: base\n  ports: [1, 2]")
+        (base_dir / "a" / "config.yaml").write_text("db:\n  user: a")
+        (base_dir / "b" / "config.yaml").write_text("db:\n  user: b")
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, base_dir / "a")
+        merged_config["db"]["host"] = "changed"
+        merged_config["db"]["ports"].append(3)
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, base_dir / "b")
+        assert len(errors) == 0
+        assert merged_config == {"db": {"host": "base", "ports": [1, 2], "user": "b"}}
+
+
+def test_merge_hierarchical_configs_recursive_anchor():
+    """Test that a config containing itself through an anchor can be merged."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        target_dir = base_dir / "level1"
+        
+        os.makedirs(target_dir, exist_ok=True)
+        (base_dir / "config.yaml").write_text("a: &x [1, *x]\nb: &y {k: *y}")
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        
+        assert len(errors) == 0
+        assert merged_config["a"][1] is merged_config["a"]
+        assert merged_config["b"]["k"] is merged_config["b"]
+        
+        # Merged on top of and underneath other configs
+        (base_dir / "config.yaml").write_text("b: {q: 1}")
+        (target_dir / "config.yaml").write_text("b: &y {k: *y}\nc: &z {k: *z}")
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        
+        assert len(errors) == 0
+        assert merged_config["b"]["q"] == 1
+        assert merged_config["b"]["k"]["k"] is merged_config["b"]["k"]
+        assert merged_config["c"]["k"] is merged_config["c"]
+
+
+def test_merge_hierarchical_configs_file_deleted_after_scan(monkeypatch):
+    """Test that files deleted between the scan and the stat are skipped."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        target_dir = base_dir / "level1"
+        
+        os.makedirs(target_dir, exist_ok=True)
+        (base_dir / "config.yaml").write_text("key: base\nshared: base")
+        (target_dir / "config.yaml").write_text("key: target")
+        
+        # Simulate the target config vanishing right after the directory scan
+        vanished = {str(target_dir / "config.yaml")}
+        file_stamp = hcm.config_merger._file_stamp
+        
+        def stamp_or_missing(file_path):
+            if file_path in vanished:
+                raise FileNotFoundError(file_path)
+            return file_stamp(file_path)
+        
+        monkeypatch.setattr(hcm.config_merger, "_file_stamp", stamp_or_missing)
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert len(errors) == 0
+        assert merged_config == {"key": "base", "shared": "base"}
+        
+        # With every file gone the hierarchy is empty
+        vanished.add(str(base_dir / "config.yaml"))
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert merged_config == {}
+        assert len(errors) == 1
+        assert "No YAML files found" in errors[0]
+
+
+def test_merge_hierarchical_configs_file_modified():
+    """Test that repeated merges pick up edited config files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        target_dir = base_dir / "level1"
+        
+        target_dir.mkdir(parents=True)
+        
+        (base_dir / "config.yaml").write_text("key: base\nshared: base")
+        target_config = target_dir / "config.yaml"
+        target_config.write_text("key: value1")
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert merged_config == {"key": "value1", "shared": "base"}
+        
+        # Edit the deepest config and force a distinct modification time
+        target_config.write_text("key: value2")
+        stat = target_config.stat()
+        os.utime(target_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        merged_config, errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
+        assert len(errors) == 0
+        assert merged_config == {"key": "value2", "shared": "base"}
+
+
+def test_parse_yaml_configs_sidecar_cache(monkeypatch):
+    """Test the opt-in on-disk parse cache written next to YAML files."""
+    monkeypatch.setenv("HCM_CACHE", "1")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file = Path(temp_dir) / "config.yaml"
+        dated_file = Path(temp_dir) / "dated.yaml"
+        sidecar = Path(temp_dir) / "config.yaml.cache.json"
+        
+        config_file.write_text("name: cached\nnested:\n  key: value")
+        # Dates do not survive a JSON round trip, no sidecar for them
+        dated_file.write_text("released: 2024-01-01")
+        
+        configs = hcm.parse_yaml_configs([config_file, dated_file])
+        
+        assert configs[str(config_file)] == {"name": "cached", "nested": {"key": "value"}}
+        assert sidecar.exists()
+        assert not (Path(temp_dir) / "dated.yaml.cache.json").exists()
+        
+        # Sidecars are never picked up as hierarchy configs
+        found_files = hcm.find_yaml_files_in_hierarchy(Path(temp_dir), Path(temp_dir))
+        assert sorted(found_files) == sorted([config_file, dated_file])
+        
+        # Editing the YAML file invalidates its sidecar
+        config_file.write_text("name: edited")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        configs = hcm.parse_yaml_configs([config_file])
+        assert configs[str(config_file)] == {"name": "edited"}
+        
+        # Without the in-memory cache, an up to date sidecar is read back
+        cached = json.loads(sidecar.read_text())
+        cached["config"] = {"name": "from sidecar"}
+        sidecar.write_text(json.dumps(cached))
+        hcm.config_merger._PARSE_CACHE.clear()
+        
+        configs = hcm.parse_yaml_configs([config_file])
+        assert configs[str(config_file)] == {"name": "from sidecar"}
+        
+        # A sidecar recorded for another version of the file is ignored
+        cached["stamp"] = [0, 0]
+        sidecar.write_text(json.dumps(cached))
+        hcm.config_merger._PARSE_CACHE.clear()
+        
+        configs = hcm.parse_yaml_configs([config_file])
+        assert configs[str(config_file)] == {"name": "edited"}
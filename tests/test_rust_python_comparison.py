@@ -3,8 +3,9 @@
 Comparison tests between Python and Rust implementations.
 """
 
+import os
 import tempfile
-import yaml
+import json
 import pytest
 import sys
 from pathlib import Path
@@ -21,11 +22,7 @@ def test_python_rust_comparison_basic():
         target_dir = base_dir / "env" / "prod" / "region" / "eu"
         
         # Create directory structure
-        base_dir.mkdir(parents=True, exist_ok=True)
-        (base_dir / "env").mkdir(exist_ok=True)
-        (base_dir / "env" / "prod").mkdir(exist_ok=True)
-        (base_dir / "env" / "prod" / "region").mkdir(exist_ok=True)
-        (base_dir / "env" / "prod" / "region" / "eu").mkdir(exist_ok=True)
+        os.makedirs(target_dir, exist_ok=True)
         
         # Create YAML configs
         configs = {
@@ -63,7 +60,20 @@ def test_python_rust_comparison_basic():
             config_path = base_dir / rel_path / "config.yaml"
             config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+                f.write(json.dumps(config_data))
+        
+        # JSON documents take the Python side's json fast path, so keep one
+        # nested block-style YAML config that both YAML parsers must read
+        (base_dir / "env" / "config.yaml").write_text(
+            "logging:\n"
+            "  level: info\n"
+            "  handlers:\n"
+            "    - console\n"
+            "    - file\n"
+            "settings:\n"
+            "  retries: 5\n"
+            "  ssl: false\n"
+        )
         
         # Test Python implementation
         py_merged, py_errors = hcm.merge_hierarchical_configs(base_dir, target_dir)
@@ -100,9 +110,7 @@ def test_python_rust_comparison_collision():
         target_dir = base_dir / "level1" / "level2"
         
         # Create directory structure
-        base_dir.mkdir(parents=True, exist_ok=True)
-        (base_dir / "level1").mkdir(exist_ok=True)
-        (base_dir / "level1" / "level2").mkdir(exist_ok=True)
+        os.makedirs(target_dir, exist_ok=True)
         
         # Create configs with same key at same depth
         (base_dir / "level1" / "config1.yaml").write_text("key: value1")
@@ -154,8 +162,31 @@ def test_python_rust_comparison_no_files():
         print("✓ Python and Rust empty directory handling is consistent")
 
 
+
+def test_python_rust_comparison_symlink_outside_base():
+    """Test that both implementations reject a target reached through a symlink out of base."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir) / "aaa"
+        outside_dir = Path(temp_dir) / "outside"
+        target_dir = base_dir / "link"
+        
+        base_dir.mkdir()
+        outside_dir.mkdir()
+        (outside_dir / "config.yaml").write_text("outside: config")
+        target_dir.symlink_to(outside_dir, target_is_directory=True)
+        
+        with pytest.raises(ValueError, match="not within base directory"):
+            hcm.merge_hierarchical_configs(base_dir, target_dir)
+        
+        with pytest.raises(RuntimeError, match="not within base directory"):
+            hcm.rust_merge_hierarchical_configs(str(base_dir), str(target_dir))
+        
+        print("✓ Python and Rust both reject symlinks leading outside the base directory")
+
+
 if __name__ == "__main__":
     test_python_rust_comparison_basic()
     test_python_rust_comparison_collision()
     test_python_rust_comparison_no_files()
+    test_python_rust_comparison_symlink_outside_base()
     print("\n🎉 All comparison tests passed! Python and Rust implementations are consistent.")
\ No newline at end of file